@@ -0,0 +1,64 @@
+"""Build single-file .pyz archives for the self-contained skill CLIs.
+
+Orchestrators that spawn a skill per workflow step pay interpreter
+startup plus a stat/open walk over the package's .py files on every
+invocation. A zipapp is one archive open instead, with bytecode
+precompiled into it so invocations skip the parse.
+
+Only the skills that do not read files relative to the source tree are
+bundled; refactor and explore resolve conventions/code-quality/ from
+their own location and would come up empty inside an archive. Brainstorm
+and design detect when they run from an archive and emit `<pyz>` commands
+(including `--perspective` for briefs) instead of paths into the bundle.
+
+Usage: python3 build_zipapp.py [outdir]   (default: dist/)
+"""
+
+import compileall
+import shutil
+import sys
+import zipapp
+from pathlib import Path
+
+_SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# skill name -> zipapp entry point.
+BUNDLES = {
+    "design": "skills.design.design:main",
+    "brainstorm": "skills.brainstorm.brainstorm:main",
+}
+
+
+def build(name: str, outdir: Path) -> Path:
+    """Build <name>.pyz into outdir and return its path."""
+    staging = outdir / f"_staging_{name}"
+    if staging.exists():
+        shutil.rmtree(staging)
+    shutil.copytree(
+        _SCRIPTS_DIR / "skills",
+        staging / "skills",
+        ignore=shutil.ignore_patterns("__pycache__"),
+    )
+    # -b layout puts .pyc next to each .py so the zip importer finds them.
+    compileall.compile_dir(str(staging), quiet=2, legacy=True, optimize=1)
+    target = outdir / f"{name}.pyz"
+    zipapp.create_archive(
+        staging,
+        target,
+        interpreter="/usr/bin/env python3",
+        main=BUNDLES[name],
+        compressed=True,
+    )
+    shutil.rmtree(staging)
+    return target
+
+
+def main() -> None:
+    outdir = Path(sys.argv[1]) if len(sys.argv) > 1 else _SCRIPTS_DIR / "dist"
+    outdir.mkdir(parents=True, exist_ok=True)
+    for name in BUNDLES:
+        print(build(name, outdir))
+
+
+if __name__ == "__main__":
+    main()
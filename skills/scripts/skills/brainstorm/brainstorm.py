@@ -0,0 +1,320 @@
+"""CLI for the brainstorm skill.
+
+Runs a seven-step ideation workflow: frame the question, fan out one
+agent per perspective, then diverge, cluster, challenge, and converge on
+the ideas before the final report.
+"""
+
+# Import-cost note: argparse is deliberately absent (main reads sys.argv
+# directly) and everything below is load-bearing at import — os/sys feed
+# the path constants, dataclass/lru_cache the step table and memoization,
+# and the two skills.lib modules supply the pieces pre-rendered into the
+# module constants. A STEPS-only importer pays for nothing it can skip.
+import os
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+
+_SCRIPTS_DIR = os.environ.get("SKILLS_SCRIPTS_DIR") or os.path.abspath(
+    __file__
+).rsplit(os.sep, 3)[0]
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+from skills.lib.perspectives import PERSPECTIVE_SUMMARIES
+from skills.lib.workflow.formatters import format_step_header, format_xml_mandate
+
+# Path results never change during the process; computed once here instead
+# of re-running abspath/dirname/join on every format_output call.
+_SCRIPT_PATH = os.path.abspath(__file__)
+_SCRIPT_DIR = os.path.dirname(_SCRIPT_PATH)
+_PERSPECTIVE_SCRIPT_PATH = os.path.join(_SCRIPT_DIR, "perspective.py")
+
+# The commands the output tells agents to run. From a checkout they invoke
+# the source files directly; from a zipapp, __file__ points inside the
+# archive where nothing is runnable, so both commands target the innermost
+# existing ancestor (the .pyz itself) and briefs route through --perspective.
+if os.path.exists(_SCRIPT_PATH):
+    _INVOKE_PATH = _SCRIPT_PATH
+    _PERSPECTIVE_COMMAND = f"python3 {_PERSPECTIVE_SCRIPT_PATH} {{pid}}"
+else:
+    _archive = _SCRIPT_DIR
+    while _archive and not os.path.exists(_archive):
+        _archive = os.path.dirname(_archive)
+    _INVOKE_PATH = _archive
+    _PERSPECTIVE_COMMAND = f"python3 {_archive} --perspective {{pid}}"
+
+
+def format_forbidden(items: list[str]) -> str:
+    lines = []
+    lines.append("<forbidden>")
+    for item in items:
+        lines.append(f"  - {item}")
+    lines.append("</forbidden>")
+    return "\n".join(lines)
+
+
+def format_perspective_selection_guidance() -> str:
+    lines = []
+    lines.append("Select 3-4 perspectives for this question:")
+    lines.append("")
+    for pid, title, question in PERSPECTIVE_SUMMARIES:
+        lines.append(f"- {pid}: {title}")
+        lines.append(f"  {question}")
+    return "\n".join(lines)
+
+
+def format_parallel_dispatch() -> str:
+    lines = []
+    lines.append("<parallel_dispatch>")
+    lines.append("  <instructions>")
+    lines.append("    Launch one ideation agent per selected perspective, all")
+    lines.append("    in a single message so they run in parallel. Each agent")
+    lines.append("    first runs the command below for its brief, then answers")
+    lines.append("    the framed question from that angle only.")
+    lines.append("  </instructions>")
+    lines.append("  <agents_to_launch>")
+    for pid, _title, _question in PERSPECTIVE_SUMMARIES:
+        lines.append(f'    <agent perspective="{pid}">')
+        lines.append(f"      {_PERSPECTIVE_COMMAND.format(pid=pid)}")
+        lines.append("    </agent>")
+    lines.append("  </agents_to_launch>")
+    lines.append("</parallel_dispatch>")
+    return "\n".join(lines)
+
+
+def format_invoke_after(command: str) -> str:
+    return f"When done, run: {command}"
+
+
+_REPORT_TEMPLATE = """\
+<brainstorm_report>
+  <question>The question as framed in step 1.</question>
+  <top_ideas>The 2-3 surviving ideas, one line each.</top_ideas>
+  <runner_ups>Ideas worth revisiting, with why they lost.</runner_ups>
+  <next_actions>The cheapest experiment per surviving idea.</next_actions>
+</brainstorm_report>"""
+
+
+def format_report_template() -> str:
+    return _REPORT_TEMPLATE
+
+
+# Fixed forbidden blocks used by the step table, rendered once here so the
+# table holds finished strings (see design.py for the same pattern).
+_FORBIDDEN_DIVERGE = format_forbidden(
+    [
+        "Evaluating or ranking ideas",
+        "Merging ideas that merely sound similar",
+    ]
+)
+
+_FORBIDDEN_CONVERGE = format_forbidden(
+    [
+        "Reviving a cluster dropped in step 5",
+        "Ranking by novelty instead of the constraints",
+    ]
+)
+
+
+# Shared across several steps; one object each instead of a literal per
+# step (CPython interns these small strings anyway, but naming them keeps
+# the banner single-sourced for the pre-render below).
+_BLANK = ""
+_OUTPUT_BANNER = "OUTPUT:"
+
+STEPS = {
+    1: {
+        "title": "Frame the question",
+        "actions": [
+            "State the question as a single sentence starting with"
+            ' "How might we".',
+            "List the constraints that any idea must respect.",
+            _BLANK,
+            _OUTPUT_BANNER,
+            "The framed question inside <question> tags.",
+        ],
+    },
+    2: {
+        "title": "Select perspectives and dispatch",
+        "needs_dispatch": True,
+        "actions": [
+            "Pick the perspectives below that pull in different directions,"
+            " then launch the dispatch block exactly as printed.",
+        ],
+    },
+    3: {
+        "title": "Diverge",
+        "actions": [
+            "Collect every idea from the agent reports, one line per idea.",
+            "Add your own; quantity over quality in this step.",
+            _FORBIDDEN_DIVERGE,
+            _BLANK,
+            _OUTPUT_BANNER,
+            "The raw idea list inside <ideas> tags.",
+        ],
+    },
+    4: {
+        "title": "Cluster",
+        "actions": [
+            "Group the ideas by the underlying mechanism, not by wording.",
+            "Name each cluster after its mechanism.",
+            _BLANK,
+            _OUTPUT_BANNER,
+            "The named clusters inside <clusters> tags.",
+        ],
+    },
+    5: {
+        "title": "Challenge",
+        "actions": [
+            "For each cluster, state the strongest reason it fails.",
+            "Drop clusters whose failure reason has no counter.",
+        ],
+    },
+    6: {
+        "title": "Converge",
+        "actions": [
+            "Rank the surviving clusters against the step-1 constraints.",
+            "Keep the top 2-3; record why each runner-up lost.",
+            _FORBIDDEN_CONVERGE,
+        ],
+    },
+    7: {
+        "title": "Report",
+        "actions": [
+            "Fill in the report template; cite steps, not vibes.",
+            _BLANK,
+            _OUTPUT_BANNER,
+            _REPORT_TEMPLATE,
+        ],
+    },
+}
+
+TOTAL_STEPS = len(STEPS)
+
+
+@dataclass(frozen=True, slots=True)
+class _StepInfo:
+    title: str
+    rendered: str
+    needs_dispatch: bool = False
+
+
+# The dispatch table format_output actually reads: a tuple indexed by
+# step - 1 of slotted records, so the hot path is one index plus fixed-
+# offset attribute loads instead of dict hashing per field. The action
+# lists are static data, so each step's joined body is rendered here once.
+_STEPS: tuple[_StepInfo, ...] = tuple(
+    _StepInfo(
+        title=spec["title"],
+        rendered="\n".join(spec.get("actions", [])),
+        needs_dispatch=spec.get("needs_dispatch", False),
+    )
+    for _, spec in sorted(STEPS.items())
+)
+
+# With the perspective command fixed at import, the whole step-2 dispatch
+# block is constant too; build it once here instead of calling the guidance
+# and dispatch formatters on every step-2 render.
+_STEP2_DISPATCH_RENDERED = "\n\n".join(
+    (
+        format_perspective_selection_guidance(),
+        format_parallel_dispatch(),
+    )
+)
+
+
+_XML_MANDATE = format_xml_mandate()
+
+
+def _full_body(i: int) -> str:
+    """Header through actions for step i, with {total} left as a placeholder."""
+    info = _STEPS[i]
+    header = format_step_header("Brainstorm", i + 1, "{total}", info.title)
+    body = f"{_XML_MANDATE}\n\n{info.rendered}" if i == 0 else info.rendered
+    if info.needs_dispatch:
+        body = f"{body}\n\n{_STEP2_DISPATCH_RENDERED}"
+    return f"{header}\n\n{body}"
+
+
+# Fully rendered outputs per step, one tuple per tail: the only runtime
+# work left in format_output is picking the table and one .format over
+# the {total}/{next} placeholders.
+_RENDERED_BODY = tuple(
+    _full_body(i)
+    + "\n\n"
+    + format_invoke_after(
+        f"python3 {_INVOKE_PATH} --step {{next}} --total-steps {{total}}"
+    )
+    for i in range(TOTAL_STEPS)
+)
+_RENDERED_COMPLETE = tuple(
+    f"{_full_body(i)}\n\nThis is the final step." for i in range(TOTAL_STEPS)
+)
+
+
+# Pure over (step, total_steps): the step table, paths, and helpers are
+# all deterministic, so replayed steps return the cached string.
+@lru_cache(maxsize=128)
+def format_output(step: int, total_steps: int) -> str:
+    # Out-of-range steps clamp to the report step: one min/max chain
+    # instead of a range test plus fallback branch.
+    idx = min(max(step, 1), TOTAL_STEPS) - 1
+    if step >= total_steps:
+        return _RENDERED_COMPLETE[idx].format(total=total_steps)
+    return _RENDERED_BODY[idx].format(total=total_steps, next=step + 1)
+
+
+_USAGE = "usage: brainstorm.py --step N [--total-steps M] | --perspective PID"
+
+
+def _int_flag(argv: list[str], flag: str) -> int:
+    """Read the integer following flag; exit with usage on malformed input."""
+    try:
+        return int(argv[argv.index(flag) + 1])
+    except ValueError:
+        sys.exit(_USAGE)
+    except IndexError:
+        sys.exit(_USAGE)
+
+
+def main() -> None:
+    # Two fixed int flags do not justify loading argparse on every cold
+    # start; the args are read straight off sys.argv (see design.py).
+    argv = sys.argv[1:]
+    if "--help" in argv or "-h" in argv:
+        print(_USAGE)
+        return
+    if "--perspective" in argv:
+        # Brief printing for dispatched agents; the zipapp bundle has no
+        # runnable perspective.py, so the dispatch block points back here.
+        from skills.lib.perspectives import PERSPECTIVES, format_brief
+
+        try:
+            pid = argv[argv.index("--perspective") + 1]
+        except IndexError:
+            sys.exit(_USAGE)
+        if pid not in PERSPECTIVES:
+            sys.exit(f"unknown perspective {pid!r}; one of: {', '.join(PERSPECTIVES)}")
+        print(format_brief(pid))
+        return
+    if "--step" not in argv:
+        sys.exit(_USAGE)
+    step = _int_flag(argv, "--step")
+    total_steps = (
+        _int_flag(argv, "--total-steps") if "--total-steps" in argv else TOTAL_STEPS
+    )
+    if total_steps < 1 or total_steps > TOTAL_STEPS:
+        sys.exit(f"total-steps must be in 1..{TOTAL_STEPS}")
+    if step < 1:
+        sys.exit("step must be >= 1")
+    if step > total_steps:
+        sys.exit(f"step must be <= total-steps ({total_steps})")
+    # One encode and one buffered write instead of print()'s text-layer
+    # processing plus a separate newline write.
+    sys.stdout.buffer.write(format_output(step, total_steps).encode("utf-8") + b"\n")
+    sys.stdout.buffer.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""Print one perspective brief for a dispatched brainstorm agent."""
+
+import os
+import sys
+
+_SCRIPTS_DIR = os.environ.get("SKILLS_SCRIPTS_DIR") or os.path.abspath(
+    __file__
+).rsplit(os.sep, 3)[0]
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+from skills.lib.perspectives import PERSPECTIVES, format_brief
+
+
+def main() -> None:
+    if len(sys.argv) != 2 or sys.argv[1] not in PERSPECTIVES:
+        sys.exit(f"usage: perspective.py {{{','.join(PERSPECTIVES)}}}")
+    print(format_brief(sys.argv[1]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""CLI for the design skill.
+
+Drives a multi-perspective design review: frame the problem, select
+perspectives, dispatch one review agent per perspective, then synthesize
+the reports into a final recommendation.
+"""
+
+import os
+import sys
+from functools import lru_cache
+
+# String surgery instead of Path(...).resolve().parents[2]: no Path objects
+# and no stat syscalls on the cold-start path. An orchestrator that already
+# knows the scripts dir can pin it via SKILLS_SCRIPTS_DIR and skip discovery.
+_SCRIPTS_DIR = os.environ.get("SKILLS_SCRIPTS_DIR") or os.path.abspath(
+    __file__
+).rsplit(os.sep, 3)[0]
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+from skills.lib.perspectives import PERSPECTIVE_SUMMARIES
+from skills.lib.workflow.formatters import format_current_action, format_step_header
+
+# Where dispatched agents find the full perspective briefs.
+PERSPECTIVE_MODULE_PATH = "skills/scripts/skills/lib/perspectives.py"
+
+# The paths the output tells the reader to use. From a checkout the step
+# footer invokes this file and briefs live in the perspectives module; from
+# a zipapp, __file__ points inside the archive where neither exists, so
+# both route through the innermost existing ancestor (the .pyz itself),
+# with briefs served by --perspective (see brainstorm.py).
+_SCRIPT_PATH = os.path.abspath(__file__)
+if os.path.exists(_SCRIPT_PATH):
+    _INVOKE_PATH = _SCRIPT_PATH
+    _BRIEF_SOURCE = PERSPECTIVE_MODULE_PATH
+else:
+    _archive = os.path.dirname(_SCRIPT_PATH)
+    while _archive and not os.path.exists(_archive):
+        _archive = os.path.dirname(_archive)
+    _INVOKE_PATH = _archive
+    _BRIEF_SOURCE = f"the output of: python3 {_archive} --perspective <its id>"
+
+
+def format_forbidden(items: list[str]) -> str:
+    lines = []
+    lines.append("<forbidden>")
+    for item in items:
+        lines.append(f"  - {item}")
+    lines.append("</forbidden>")
+    return "\n".join(lines)
+
+
+def _build_perspective_selection_guidance() -> str:
+    lines = []
+    lines.append("Select 3-4 perspectives for this problem:")
+    lines.append("")
+    for pid, title, question in PERSPECTIVE_SUMMARIES:
+        lines.append(f"- {pid}: {title}")
+        lines.append(f"  {question}")
+    lines.append("")
+    lines.append("Prefer perspectives likely to disagree; consensus picks waste agents.")
+    return "\n".join(lines)
+
+
+# The per-perspective <agent> entries never vary, so the inner block is one
+# precomputed string and the dispatch renderer is a single template fill.
+_AGENTS_BLOCK = "\n".join(
+    f'    <agent perspective="{pid}">\n      {title}: {question}\n    </agent>'
+    for pid, title, question in PERSPECTIVE_SUMMARIES
+)
+
+_DISPATCH_TEMPLATE = """\
+<parallel_dispatch>
+  <instructions>
+    Launch one design-review agent per selected perspective,
+    all in a single message so they run in parallel. Each
+    agent reads its brief in {module}
+    plus the problem frame from step 1.
+  </instructions>
+  <agents_to_launch>
+{agents}
+  </agents_to_launch>
+</parallel_dispatch>"""
+
+
+# The formatters above iterate a frozen table and take no arguments, so
+# their output is constant for the life of the process; render each once at
+# import and keep the public names as thin accessors over the constants.
+_PERSPECTIVE_GUIDANCE = _build_perspective_selection_guidance()
+_PARALLEL_DISPATCH = _DISPATCH_TEMPLATE.format(
+    module=_BRIEF_SOURCE, agents=_AGENTS_BLOCK
+)
+
+
+def format_parallel_dispatch() -> str:
+    return _PARALLEL_DISPATCH
+
+
+def format_perspective_selection_guidance() -> str:
+    return _PERSPECTIVE_GUIDANCE
+
+
+_SYNTHESIS_TEMPLATE = """\
+<synthesis>
+  <agreements>Points at least two perspectives raised independently.</agreements>
+  <tensions>Where perspectives directly conflict, and why.</tensions>
+  <blind_spots>Risks no perspective covered.</blind_spots>
+</synthesis>"""
+
+_FINAL_REPORT_TEMPLATE = """\
+<final_report>
+  <recommendation>The chosen design, in two sentences.</recommendation>
+  <rationale>Why it wins over the alternatives considered.</rationale>
+  <risks>Top risks with their mitigations.</risks>
+  <open_questions>What must be answered before implementation.</open_questions>
+</final_report>"""
+
+
+def format_synthesis_analysis_template() -> str:
+    return _SYNTHESIS_TEMPLATE
+
+
+def format_final_report_template() -> str:
+    return _FINAL_REPORT_TEMPLATE
+
+
+# Forbidden blocks used inside STEPS are fixed lists; render them once here
+# so the table below holds finished strings.
+_FORBIDDEN_FRAMING = format_forbidden(
+    [
+        "Proposing a solution in this step",
+        "Restating requirements without constraints",
+    ]
+)
+
+_FORBIDDEN_SYNTHESIS = format_forbidden(
+    [
+        "Averaging conflicting positions into mush",
+        "Dropping a tension because it is inconvenient",
+    ]
+)
+
+
+STEPS = {
+    1: {
+        "name": "Frame the problem",
+        "actions": [
+            "State the problem, the constraints, and what success looks like.",
+            "List the alternatives already rejected, and why.",
+            _FORBIDDEN_FRAMING,
+        ],
+    },
+    2: {
+        "name": "Select perspectives",
+        "actions": [
+            "Pick the perspectives below that stress this problem hardest.",
+        ],
+    },
+    3: {
+        "name": "Dispatch perspective reviews",
+        "actions": [
+            "Launch the dispatch block exactly as printed.",
+        ],
+    },
+    4: {
+        "name": "Synthesize findings",
+        "actions": [
+            "Merge the agent reports into the synthesis template.",
+            _FORBIDDEN_SYNTHESIS,
+        ],
+    },
+    5: {
+        "name": "Final report",
+        "actions": [
+            "Commit to one design and fill in the report template.",
+        ],
+    },
+}
+
+TOTAL_STEPS = len(STEPS)
+
+# (name, pre-joined actions) per step, indexed by step - 1. The actions
+# never change after import, so joining them here leaves format_output with
+# a tuple index instead of a dict lookup plus a per-call join.
+_STEPS_FROZEN: tuple[tuple[str, str], ...] = tuple(
+    (spec["name"], format_current_action(spec["actions"]))
+    for _, spec in sorted(STEPS.items())
+)
+
+
+# Pure over a tiny (step, total_steps) key space; workflow replays hit the
+# cache instead of re-assembling the same output.
+@lru_cache(maxsize=64)
+def format_output(step: int, total_steps: int) -> str:
+    name, actions_joined = _STEPS_FROZEN[step - 1]
+    parts = [format_step_header("Design", step, total_steps, name)]
+    parts.append(actions_joined)
+    if step == 1:
+        # Only step 1 carries the mandate; bind it when that step renders.
+        from skills.lib.workflow.formatters import format_xml_mandate
+
+        parts.append(format_xml_mandate())
+    elif step == 2:
+        parts.append(_PERSPECTIVE_GUIDANCE)
+    elif step == 3:
+        parts.append(_PARALLEL_DISPATCH)
+    elif step == 4:
+        parts.append(_SYNTHESIS_TEMPLATE)
+    elif step == 5:
+        parts.append(_FINAL_REPORT_TEMPLATE)
+    if step == total_steps:
+        parts.append("This is the final step.")
+    else:
+        parts.append(
+            f"When done, run: python3 {_INVOKE_PATH} --step {step + 1}"
+            f" --total-steps {total_steps}"
+        )
+    return "\n\n".join(parts)
+
+
+# Encoded once per (step, total_steps); the second invocation for the same
+# pair is a dict lookup plus one write on the binary stream.
+@lru_cache(maxsize=64)
+def format_output_bytes(step: int, total_steps: int) -> bytes:
+    return format_output(step, total_steps).encode("utf-8")
+
+
+# Rendered payloads persist here across processes, one file per
+# (total_steps, step) pair, so steady-state invocations skip Python-level
+# formatting entirely.
+_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "finansheet-skills",
+)
+
+
+@lru_cache(maxsize=1)
+def _cache_tag() -> str:
+    """Digest of the modules whose content ends up in the payloads.
+
+    The cache filename carries this tag, so editing design.py, the
+    perspective table, or the shared formatters — or running from a
+    different checkout — misses cleanly instead of serving stale output.
+    """
+    import hashlib
+
+    from skills.lib import perspectives
+    from skills.lib.workflow import formatters
+
+    digest = hashlib.sha1()
+    for source in (__file__, perspectives.__file__, formatters.__file__):
+        digest.update(source.encode())
+        digest.update(str(os.path.getmtime(source)).encode())
+    return digest.hexdigest()[:12]
+
+
+def _cached_payload(step: int, total_steps: int) -> bytes:
+    try:
+        tag = _cache_tag()
+    except OSError:
+        # Sources without a usable mtime (e.g. inside an archive): no cache.
+        return format_output_bytes(step, total_steps)
+    path = os.path.join(_CACHE_DIR, f"design-{tag}-{total_steps}-{step}.txt")
+    try:
+        with open(path, "rb") as handle:
+            return handle.read()
+    except OSError:
+        pass
+    payload = format_output_bytes(step, total_steps)
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}"
+        with open(tmp, "wb") as handle:
+            handle.write(payload)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    return payload
+
+
+_USAGE = "usage: design.py --step N [--total-steps M] | --perspective PID"
+
+
+def _int_flag(argv: list[str], flag: str) -> int:
+    """Read the integer following flag; exit with usage on malformed input."""
+    try:
+        return int(argv[argv.index(flag) + 1])
+    except ValueError:
+        sys.exit(_USAGE)
+    except IndexError:
+        sys.exit(_USAGE)
+
+
+def main() -> None:
+    # The argument shape is fixed (two int flags), so the args are read
+    # straight off sys.argv; loading argparse would dominate the runtime
+    # of this script just to parse them.
+    argv = sys.argv[1:]
+    if "--perspective" in argv:
+        # Brief printing for dispatched agents; the zipapp bundle has no
+        # readable perspectives.py, so the dispatch block points back here.
+        from skills.lib.perspectives import PERSPECTIVES, format_brief
+
+        try:
+            pid = argv[argv.index("--perspective") + 1]
+        except IndexError:
+            sys.exit(_USAGE)
+        if pid not in PERSPECTIVES:
+            sys.exit(f"unknown perspective {pid!r}; one of: {', '.join(PERSPECTIVES)}")
+        print(format_brief(pid))
+        return
+    if "--step" not in argv:
+        sys.exit(_USAGE)
+    step = _int_flag(argv, "--step")
+    total_steps = (
+        _int_flag(argv, "--total-steps") if "--total-steps" in argv else TOTAL_STEPS
+    )
+    if total_steps < 1 or total_steps > TOTAL_STEPS:
+        sys.exit(f"total-steps must be in 1..{TOTAL_STEPS}")
+    if step < 1:
+        sys.exit("step must be >= 1")
+    if step > total_steps:
+        sys.exit(f"step must be <= total-steps ({total_steps})")
+    out = sys.stdout.buffer
+    out.write(_cached_payload(step, total_steps))
+    out.write(b"\n")
+    out.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""CLI for the explore skill.
+
+Guides a structured walk of an unfamiliar codebase; step 1 primes the
+exploration with the code-quality category catalog as reading lenses.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from types import MappingProxyType
+
+# Resolve once; both the import path and CONVENTIONS_DIR derive from it.
+_HERE = Path(__file__).resolve()
+sys.path.insert(0, str(_HERE.parents[2]))
+
+from skills.lib.workflow.cli import bare_step, validate_step, write_output
+
+
+def load_category_blocks() -> list[tuple[str, str]]:
+    """Return (category name, source file) pairs from the code-quality docs.
+
+    Reads the shared convention catalog, imported on first use: only step 1
+    prints the catalog, and the other steps should not pay for loading the
+    parser. The loader caches the parse, so repeat calls are list rebuilds
+    over the shared tuple.
+    """
+    from skills.lib.conventions import parse_categories
+
+    return [(cat["name"], cat["file"]) for cat in parse_categories()]
+
+
+# Frozen at import: step specs are lookup tables, not mutable state.
+STEPS = MappingProxyType({
+    1: {
+        "name": "Survey with quality lenses",
+        "actions": (
+            "Skim the tree top-down: entry points, build config, test layout.",
+            "Keep the lenses below in mind; note where any of them seems to"
+            " be violated, but do not fix anything yet.",
+        ),
+    },
+    2: {
+        "name": "Map entry points",
+        "actions": (
+            "List every way execution enters the system (CLIs, routes, jobs).",
+            "For each entry point, name the module that owns it.",
+        ),
+    },
+    3: {
+        "name": "Trace data flow",
+        "actions": (
+            "Pick the two most important entry points and trace their data"
+            " to the point of persistence or output.",
+            "Record each transformation and the module that performs it.",
+        ),
+    },
+    4: {
+        "name": "Report",
+        "actions": (
+            "Summarize: architecture, load-bearing modules, risk areas.",
+            "Cite file:line for every claim.",
+        ),
+    },
+})
+
+TOTAL_STEPS = len(STEPS)
+
+# Static per-step text, joined once at import (see the refactor CLI).
+_STEP_PREFIX = {
+    step: "\n".join(
+        (
+            f"=== Explore step {step}/{TOTAL_STEPS}: {spec['name']} ===",
+            "",
+            *spec["actions"],
+        )
+    )
+    for step, spec in STEPS.items()
+}
+
+_STEP_FOOTER = {
+    step: "This is the final step."
+    if step == TOTAL_STEPS
+    else f"When done, run: python explore.py {step + 1}"
+    for step in STEPS
+}
+
+
+def format_output(step: int) -> str:
+    # Blank-line separators come from the block join, not append("") calls.
+    parts = [_STEP_PREFIX[step]]
+    if step == 1:
+        parts.append(
+            "\n".join(
+                (
+                    "Lenses:",
+                    *(
+                        f"- {name} (conventions/code-quality/{source})"
+                        for name, source in load_category_blocks()
+                    ),
+                )
+            )
+        )
+    parts.append(_STEP_FOOTER[step])
+    return "\n\n".join(parts)
+
+
+def main() -> None:
+    # Fast path for the common bare-step invocation (see bare_step).
+    step = bare_step(TOTAL_STEPS)
+    if step is not None:
+        write_output(format_output(step))
+        return
+    parser = argparse.ArgumentParser(
+        description="Step-by-step exploration of an unfamiliar codebase."
+    )
+    parser.add_argument("step", type=int, help=f"1-based step number (1..{TOTAL_STEPS})")
+    args = parser.parse_args()
+    validate_step(parser, args.step, TOTAL_STEPS)
+    write_output(format_output(args.step))
+
+
+if __name__ == "__main__":
+    main()
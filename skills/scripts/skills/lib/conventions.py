@@ -0,0 +1,136 @@
+"""Cached loader for the code-quality convention catalog.
+
+The refactor and explore skills both read category headings out of
+conventions/code-quality/. Parsing lives here so every consumer shares one
+in-process catalog (and one on-disk cache) instead of each skill compiling
+its own pattern and re-reading the docs.
+"""
+
+import os
+import pickle
+import sys
+from itertools import islice
+from pathlib import Path
+
+CONVENTIONS_DIR = Path(__file__).resolve().parents[4] / "conventions" / "code-quality"
+
+_CATEGORIES_CACHE: tuple[dict, ...] | None = None
+
+# Parsed catalogs persist across processes here, keyed on the source file
+# mtimes; a stale or unreadable cache file silently falls back to parsing.
+_DISK_CACHE = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "finansheet-skills"
+    / "categories.pickle"
+)
+
+
+_CATALOG_FILES: tuple[Path, ...] | None = None
+
+
+def _catalog_files() -> tuple[Path, ...]:
+    """Sorted doc paths, globbed once per process."""
+    global _CATALOG_FILES
+    if _CATALOG_FILES is None:
+        _CATALOG_FILES = tuple(sorted(CONVENTIONS_DIR.glob("[0-9]*.md")))
+    return _CATALOG_FILES
+
+
+# Bumped whenever the shape of the cached category dicts changes, so stale
+# pickles from an older schema are treated as misses.
+_CACHE_SCHEMA = 2
+
+
+def _catalog_key() -> tuple:
+    return (
+        _CACHE_SCHEMA,
+        tuple(
+            (md_file.name, md_file.stat().st_mtime_ns)
+            for md_file in _catalog_files()
+        ),
+    )
+
+
+def _load_disk_cache(key: tuple) -> tuple[dict, ...] | None:
+    try:
+        with _DISK_CACHE.open("rb") as handle:
+            cached_key, categories = pickle.load(handle)
+    except (OSError, pickle.PickleError, EOFError, ValueError):
+        return None
+    if cached_key != key:
+        return None
+    # Pickled strings come back un-interned; restore sharing with the rest
+    # of the process (refs, agent lines) before handing the catalog out.
+    for cat in categories:
+        cat["name"] = sys.intern(cat["name"])
+        cat["file"] = sys.intern(cat["file"])
+    return categories
+
+
+def _store_disk_cache(key: tuple, categories: tuple[dict, ...]) -> None:
+    try:
+        _DISK_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with _DISK_CACHE.open("wb") as handle:
+            pickle.dump((key, categories), handle, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
+def parse_categories() -> tuple[dict, ...]:
+    """Parse `## N. Title` category headings from the code-quality docs.
+
+    Parsed once per process; the docs do not change while a workflow run is
+    in flight, so repeat calls reuse the cached result instead of re-reading
+    every markdown file. Cached as a tuple so callers can hold the sequence
+    without being able to grow or reorder the shared catalog, and mirrored
+    to a pickle on disk so later processes skip the parse while the source
+    mtimes are unchanged.
+    """
+    global _CATEGORIES_CACHE
+    if _CATEGORIES_CACHE is not None:
+        return _CATEGORIES_CACHE
+    key = _catalog_key()
+    cached = _load_disk_cache(key)
+    if cached is not None:
+        _CATEGORIES_CACHE = cached
+        return _CATEGORIES_CACHE
+    categories = []
+    for md_file in _catalog_files():
+        # Headings have a fixed "## " prefix and ". " separator, so plain
+        # bytes startswith/partition cover the grammar; no regex engine (or
+        # the re import) is needed on the cold-start path.
+        for line_no, line in enumerate(md_file.read_bytes().split(b"\n"), 1):
+            if not line.startswith(b"## "):
+                continue
+            number, sep, raw_name = line[3:].partition(b". ")
+            if not sep or not number.isdigit():
+                continue
+            name = sys.intern(raw_name.decode("utf-8"))
+            ref = f"conventions/code-quality/{md_file.name}:{line_no}"
+            categories.append(
+                {
+                    "number": int(number),
+                    "name": name,
+                    "file": sys.intern(md_file.name),
+                    "line": line_no,
+                    "ref": ref,
+                    "agent": f'    <agent category="{name}" ref="{ref}" />',
+                }
+            )
+    _CATEGORIES_CACHE = tuple(categories)
+    _store_disk_cache(key, _CATEGORIES_CACHE)
+    return _CATEGORIES_CACHE
+
+
+def load_category_block(category: dict) -> str:
+    """Return the markdown block for one category (heading to next heading)."""
+    path = CONVENTIONS_DIR / category["file"]
+    block = []
+    with path.open(encoding="utf-8") as handle:
+        lines = islice(handle, category["line"] - 1, None)
+        block.append(next(lines).rstrip("\n"))
+        for line in lines:
+            if line.startswith("## "):
+                break
+            block.append(line.rstrip("\n"))
+    return "\n".join(block).rstrip()
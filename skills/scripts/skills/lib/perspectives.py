@@ -0,0 +1,49 @@
+"""Analytical perspectives shared by the design and brainstorm skills."""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+
+# Frozen at import: the perspective vocabulary is a fixed table, not state.
+PERSPECTIVES = MappingProxyType({
+    "user-advocate": {
+        "title": "User Advocate",
+        "question": "Where does this make the user's task slower or harder?",
+    },
+    "systems-thinker": {
+        "title": "Systems Thinker",
+        "question": "Which second-order effects appear once this ships?",
+    },
+    "skeptic": {
+        "title": "Skeptic",
+        "question": "Which assumption, if wrong, sinks the whole approach?",
+    },
+    "pragmatist": {
+        "title": "Pragmatist",
+        "question": "What is the smallest version that still proves the idea?",
+    },
+    "futurist": {
+        "title": "Futurist",
+        "question": "What does this look like after two years of growth?",
+    },
+    "operator": {
+        "title": "Operator",
+        "question": "How is this debugged, monitored, and rolled back at 3am?",
+    },
+})
+
+PERSPECTIVE_ORDER = tuple(PERSPECTIVES)
+
+# (pid, title, question) triples in declaration order, for formatters that
+# only need the summary line and not the full spec dict.
+PERSPECTIVE_SUMMARIES = tuple(
+    (pid, spec["title"], spec["question"]) for pid, spec in PERSPECTIVES.items()
+)
+
+
+def format_brief(pid: str) -> str:
+    """Render the brief a dispatched agent reads before ideating."""
+    spec = PERSPECTIVES[pid]
+    return (
+        f"{spec['title']}\n\nHold this question while you ideate:\n{spec['question']}"
+    )
@@ -0,0 +1,42 @@
+"""Shared CLI helpers for the skill scripts."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+
+def validate_step(
+    parser: argparse.ArgumentParser, step: int, total_steps: int
+) -> None:
+    """Reject step numbers outside 1..total_steps with a consistent message."""
+    if not 1 <= step <= total_steps:
+        parser.error(f"step must be in 1..{total_steps}")
+
+
+def bare_step(total_steps: int) -> int | None:
+    """Return the step from a bare `script N` invocation, else None.
+
+    The common invocation is a single positional step number, which needs
+    no argparse machinery; callers handle a hit directly and fall through
+    to their parser for anything else (flags, bad input) so real
+    validation and error messages stay in one place.
+    """
+    if len(sys.argv) == 2 and sys.argv[1].isdigit():
+        step = int(sys.argv[1])
+        if 1 <= step <= total_steps:
+            return step
+    return None
+
+
+def write_output(text: str) -> None:
+    """Write a rendered step to stdout as one binary payload.
+
+    Bypasses print()'s text layer: the payload is encoded once and handed
+    to the buffered binary stream with its trailing newline, instead of
+    going through per-call codec and newline translation.
+    """
+    out = sys.stdout.buffer
+    out.write(text.encode("utf-8"))
+    out.write(b"\n")
+    out.flush()
@@ -0,0 +1,24 @@
+"""Core primitives for step-based skill CLIs."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+
+class LinearRouting:
+    """Routing that always advances to the next step."""
+
+    __slots__ = ()
+
+    def next_step(self, current: int, total: int) -> int | None:
+        return current + 1 if current < total else None
+
+
+@dataclass(frozen=True, slots=True)
+class Step:
+    """One workflow step: a display name plus the actions to perform."""
+
+    name: str
+    actions: Sequence[str]
+    routing: LinearRouting
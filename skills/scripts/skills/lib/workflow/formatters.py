@@ -0,0 +1,37 @@
+"""Shared output formatters for skill CLIs."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+
+def format_step_header(skill: str, step: int, total_steps: int, name: str) -> str:
+    return f"=== {skill} step {step}/{total_steps}: {name} ==="
+
+
+def format_current_action(actions: Sequence[str]) -> str:
+    return "\n".join(actions)
+
+
+_XML_MANDATE = """\
+<output_mandate>
+  Wrap every deliverable in the XML tags named by the step.
+  Untagged prose is treated as scratch work and discarded.
+</output_mandate>"""
+
+
+def format_xml_mandate() -> str:
+    return _XML_MANDATE
+
+
+def _indent(body: str) -> str:
+    # One C-level replace beats splitting into lines and re-joining.
+    return "    " + body.replace("\n", "\n    ")
+
+
+def format_expected_output(sections: dict[str, str]) -> str:
+    """Render an <expected_output> block from tag -> body sections."""
+    body = "\n".join(
+        f"  <{tag}>\n{_indent(text)}\n  </{tag}>" for tag, text in sections.items()
+    )
+    return f"<expected_output>\n{body}\n</expected_output>"
@@ -0,0 +1,59 @@
+"""CLI for the optimize skill: print the current step of a workflow."""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from skills.lib.workflow.cli import validate_step, write_output
+from skills.optimize.workflows import _SCOPES_SET, SCOPES, WORKFLOWS
+
+
+def _render(scope: str, step: int) -> str:
+    steps = WORKFLOWS[scope]
+    current = steps[step - 1]
+    lines = []
+    lines.append(f"=== Optimize [{scope}] step {step}/{len(steps)}: {current.name} ===")
+    lines.append("")
+    for action in current.actions:
+        lines.append(action)
+    lines.append("")
+    nxt = current.routing.next_step(step, len(steps))
+    if nxt is None:
+        lines.append("This is the final step.")
+    else:
+        lines.append(f"When done, run: python optimize.py {scope} {nxt}")
+    return "\n".join(lines)
+
+
+# Every (scope, step) output is static, so render the lot once at import and
+# make format_output a dict lookup.
+_RENDERED: dict[tuple[str, int], str] = {
+    (scope, step): _render(scope, step)
+    for scope in SCOPES
+    for step in range(1, len(WORKFLOWS[scope]) + 1)
+}
+
+
+def format_output(scope: str, step: int) -> str:
+    return _RENDERED[(scope, step)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Step-by-step prompt optimization workflows."
+    )
+    parser.add_argument("scope", help=f"one of: {', '.join(SCOPES)}")
+    parser.add_argument("step", type=int, help="1-based step number")
+    args = parser.parse_args()
+    if args.scope not in _SCOPES_SET:
+        parser.error(
+            f"unknown scope {args.scope!r}; expected one of: {', '.join(SCOPES)}"
+        )
+    validate_step(parser, args.step, len(WORKFLOWS[args.scope]))
+    write_output(format_output(args.scope, args.step))
+
+
+if __name__ == "__main__":
+    main()
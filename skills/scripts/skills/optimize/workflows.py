@@ -0,0 +1,274 @@
+"""Workflow definitions for the optimize skill.
+
+Each scope is an ordered sequence of Steps the CLI walks one at a time:
+
+- single-prompt: tighten one existing prompt in place
+- ecosystem: optimize a set of prompts that feed each other
+- greenfield: design a prompt system before any prompt exists
+- problem: work backwards from an observed failure
+"""
+
+import sys
+from collections.abc import Iterable, Mapping
+from itertools import chain
+from types import MappingProxyType
+
+from skills.lib.workflow.core import LinearRouting, Step
+
+# Declared ahead of WORKFLOWS so the tuple literal drives registry
+# construction; the assert at the bottom keeps the two in sync.
+SCOPES: tuple[str, ...] = ("single-prompt", "ecosystem", "greenfield", "problem")
+_SCOPES_SET = frozenset(SCOPES)
+
+# LinearRouting is stateless, so every Step shares one instance.
+_LINEAR = LinearRouting()
+
+
+def _pooled(actions: Iterable[str]) -> tuple[str, ...]:
+    """Intern action strings so lines repeated across workflows share one object."""
+    return tuple(map(sys.intern, actions))
+
+
+def understand_actions(entity: str) -> list[str]:
+    return [
+        f"Read the {entity.lower()} end to end before judging any part of it.",
+        f"List every behavior the {entity.lower()} is responsible for producing.",
+        "For each behavior, note which lines actually carry it.",
+        "Mark lines no behavior depends on as candidates for deletion.",
+    ]
+
+
+# Shared by understand_actions_ecosystem and the greenfield rules step so
+# the two copies cannot drift apart.
+_CONTRASTIVE_EXAMPLES: tuple[str, ...] = (
+    "For every rule you introduce, show a contrastive pair:",
+    "<example type='CORRECT'>",
+    "  [input] -> [output the rule produces]",
+    "</example>",
+    "<example type='INCORRECT'>",
+    "  [input] -> [failure the rule prevents]",
+    "</example>",
+)
+
+
+def understand_actions_ecosystem() -> list[str]:
+    return [
+        "Map every prompt in the ecosystem and the artifacts flowing between them.",
+        "For each edge, record the producing prompt, the consuming prompt, and"
+        " the format contract between them.",
+        "Flag contracts that exist only by convention (no prompt states them).",
+        *_CONTRASTIVE_EXAMPLES,
+    ]
+
+
+# One substitution pass per line instead of four f-strings re-formatting
+# {entity} / {entity.lower()} on every call.
+_CHANGE_FORMAT_TEMPLATE_LINES: tuple[str, ...] = (
+    "Format each {low}:",
+    "  === {up} N: [title] ===",
+    "  [one-line intent of the {low}]",
+    "  [rewritten {low}, tightest form that keeps behavior]",
+    "Keep numbering stable so revisions stay diffable.",
+)
+
+_CHANGE_FORMAT_ENTITIES = ("Prompt", "Section", "Contract")
+
+
+def change_format_actions(entity: str) -> list[str]:
+    cached = _CHANGE_FORMAT_TEMPLATES.get(entity)
+    if cached is not None:
+        return list(cached)
+    subs = {"low": entity.lower(), "up": entity}
+    return [line.format_map(subs) for line in _CHANGE_FORMAT_TEMPLATE_LINES]
+
+
+# Pre-rendered at import for the entities the workflows actually use;
+# change_format_actions falls back to format_map for anything else.
+_CHANGE_FORMAT_TEMPLATES: dict[str, tuple[str, ...]] = {
+    entity: tuple(
+        line.format_map({"low": entity.lower(), "up": entity})
+        for line in _CHANGE_FORMAT_TEMPLATE_LINES
+    )
+    for entity in _CHANGE_FORMAT_ENTITIES
+}
+
+
+# Only the header line varies with the audit target; the checklist tail is
+# a constant shared by every call.
+_ANTI_PATTERN_AUDIT_TAIL: tuple[str, ...] = (
+    "- Rules stated once and contradicted later",
+    "- Examples that disagree with the stated rules",
+    "- Vague qualifiers ('as appropriate', 'if needed') on load-bearing steps",
+    "- Output format described in prose instead of shown literally",
+    "Record each hit as [severity] plus quoted text plus a proposed fix.",
+)
+
+
+def anti_pattern_audit_actions(target: str) -> list[str]:
+    return [
+        f"Audit {target} for known prompt anti-patterns:",
+        *_ANTI_PATTERN_AUDIT_TAIL,
+    ]
+
+
+SINGLE_PROMPT_STEPS: tuple[Step, ...] = (
+    Step(
+        name="Understand",
+        actions=_pooled(understand_actions("Prompt")),
+        routing=_LINEAR,
+    ),
+    Step(
+        name="Audit",
+        actions=_pooled(anti_pattern_audit_actions("the prompt")),
+        routing=_LINEAR,
+    ),
+    Step(
+        name="Restructure",
+        actions=_pooled(chain(
+            change_format_actions("Section"),
+            (
+                "Preserve every behavior identified in step 1; restructuring"
+                " is not license to change semantics.",
+            ),
+        )),
+        routing=_LINEAR,
+    ),
+    Step(
+        name="Verify",
+        actions=_pooled([
+            "Re-run the behavior inventory from step 1 against the rewrite.",
+            "For each behavior, quote the line in the rewrite that now carries it.",
+            "Report behaviors lost, behaviors added, and net size change.",
+        ]),
+        routing=_LINEAR,
+    ),
+)
+
+ECOSYSTEM_STEPS: tuple[Step, ...] = (
+    Step(
+        name="Map the ecosystem",
+        actions=_pooled(understand_actions_ecosystem()),
+        routing=_LINEAR,
+    ),
+    Step(
+        name="Audit each prompt",
+        actions=_pooled(anti_pattern_audit_actions("each prompt in the map")),
+        routing=_LINEAR,
+    ),
+    Step(
+        name="Normalize contracts",
+        actions=_pooled(chain(
+            change_format_actions("Contract"),
+            (
+                "Every consumer must be able to parse what its producer"
+                " emits; state each contract in both prompts.",
+            ),
+        )),
+        routing=_LINEAR,
+    ),
+    Step(
+        name="Verify end to end",
+        actions=_pooled([
+            "Trace one realistic artifact through the full ecosystem.",
+            "At each hop, check the emitted format against the stated contract.",
+            "Report every hop where the artifact would be misread or dropped.",
+        ]),
+        routing=_LINEAR,
+    ),
+)
+
+GREENFIELD_STEPS: tuple[Step, ...] = (
+    Step(
+        name="Clarify outcomes",
+        actions=_pooled([
+            "State the observable outputs the prompt system must produce.",
+            "For each output, name who consumes it and what they do next.",
+            "Reject outcomes that cannot be checked from the output alone.",
+        ]),
+        routing=_LINEAR,
+    ),
+    Step(
+        name="Inventory inputs",
+        actions=_pooled([
+            "List every input the system receives and its trust level.",
+            "Mark inputs that can contain instructions aimed at the model.",
+            "Decide per input: obey, quote, or summarize.",
+        ]),
+        routing=_LINEAR,
+    ),
+    Step(
+        name="Draft structure",
+        actions=_pooled(change_format_actions("Section")),
+        routing=_LINEAR,
+    ),
+    Step(
+        name="Write rules with examples",
+        actions=_pooled(chain(
+            ("Write each rule as a single imperative sentence.",),
+            _CONTRASTIVE_EXAMPLES,
+        )),
+        routing=_LINEAR,
+    ),
+    Step(
+        name="Red-team the draft",
+        actions=_pooled(anti_pattern_audit_actions("the draft")),
+        routing=_LINEAR,
+    ),
+    Step(
+        name="Finalize",
+        actions=_pooled([
+            "Resolve every audit hit or record why it is accepted.",
+            "Emit the final prompt system with stable section numbering.",
+        ]),
+        routing=_LINEAR,
+    ),
+)
+
+PROBLEM_STEPS: tuple[Step, ...] = (
+    Step(
+        name="Reproduce the failure",
+        actions=_pooled([
+            "Capture the exact input, prompt version, and bad output.",
+            "Reduce the input to the smallest form that still fails.",
+        ]),
+        routing=_LINEAR,
+    ),
+    Step(
+        name="Localize",
+        actions=_pooled([
+            "Binary-search the prompt: remove halves until the failure flips.",
+            "Quote the minimal span whose presence or absence controls the bug.",
+        ]),
+        routing=_LINEAR,
+    ),
+    Step(
+        name="Fix minimally",
+        actions=_pooled([
+            "Change only the localized span; leave the rest byte-identical.",
+            "Prefer adding a contrastive example over adding a new rule.",
+        ]),
+        routing=_LINEAR,
+    ),
+    Step(
+        name="Verify the fix",
+        actions=_pooled([
+            "Re-run the reduced reproduction and two unreduced variants.",
+            "Spot-check three previously passing inputs for regressions.",
+        ]),
+        routing=_LINEAR,
+    ),
+)
+
+_STEPS_BY_SCOPE = {
+    "single-prompt": SINGLE_PROMPT_STEPS,
+    "ecosystem": ECOSYSTEM_STEPS,
+    "greenfield": GREENFIELD_STEPS,
+    "problem": PROBLEM_STEPS,
+}
+
+# Read-only view: consumers get fast lookups but cannot mutate the registry.
+WORKFLOWS: Mapping[str, tuple[Step, ...]] = MappingProxyType(
+    {scope: _STEPS_BY_SCOPE[scope] for scope in SCOPES}
+)
+
+assert set(SCOPES) == WORKFLOWS.keys(), "SCOPES and WORKFLOWS out of sync"
@@ -0,0 +1,236 @@
+"""CLI for the refactor skill.
+
+Walks the refactor workflow step by step; step 2 selects code-quality
+categories from conventions/code-quality/ and emits a parallel dispatch
+block, one review agent per category.
+"""
+
+import argparse
+import sys
+from bisect import bisect_left
+from collections.abc import Sequence
+from pathlib import Path
+from types import MappingProxyType
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+# Catalog parsing and caching live in the shared loader so the explore
+# skill (and any future consumer) reuses the same in-process catalog.
+from skills.lib.conventions import load_category_block, parse_categories
+from skills.lib.workflow.cli import bare_step, validate_step, write_output
+
+# How many categories step 2 dispatches in one wave.
+DISPATCH_WIDTH = 4
+
+_NAME_INDEX: tuple[tuple[str, ...], tuple[dict, ...]] | None = None
+
+
+def _name_index() -> tuple[tuple[str, ...], tuple[dict, ...]]:
+    """Sorted lowercased names plus parallel categories, built once per process.
+
+    Bisect over the sorted names gives prefix lookup in O(len(prefix) * log n)
+    without scanning the catalog; at 34 names a trie buys nothing beyond that.
+    """
+    global _NAME_INDEX
+    if _NAME_INDEX is None:
+        pairs = sorted(
+            ((cat["name"].lower(), cat) for cat in parse_categories()),
+            key=lambda pair: pair[0],
+        )
+        _NAME_INDEX = (
+            tuple(name for name, _ in pairs),
+            tuple(cat for _, cat in pairs),
+        )
+    return _NAME_INDEX
+
+
+def find_categories(prefix: str) -> list[dict]:
+    """Return categories whose name starts with prefix (case-insensitive)."""
+    key = prefix.lower()
+    names, cats = _name_index()
+    lo = bisect_left(names, key)
+    hi = lo
+    while hi < len(names) and names[hi].startswith(key):
+        hi += 1
+    return list(cats[lo:hi])
+
+
+def select_categories(n: int) -> Sequence[dict]:
+    """Pick n distinct categories at random from the catalog."""
+    all_cats = parse_categories()
+    if n >= len(all_cats):
+        # Sampling everything is just a shuffle; hand back the cached tuple.
+        return all_cats
+    import random
+
+    return random.sample(all_cats, n)
+
+
+def _read_ref_lines(categories: list[dict]) -> list[str]:
+    return [
+        f"- conventions/code-quality/{cat['file']} (line {cat['line']}):"
+        f" {cat['name']}"
+        for cat in categories
+    ]
+
+
+def read_refs(categories: list[dict]) -> str:
+    return "\n".join(_read_ref_lines(categories))
+
+
+# Only the <agent/> lines vary per call; everything else is one template.
+_DISPATCH_TEMPLATE = """\
+<parallel_dispatch>
+  <instructions>
+    Launch one review agent per category, all in a single
+    message so they run in parallel. Each agent reads only
+    its category block plus the files under review.
+  </instructions>
+  <agents_to_launch>
+{agents}
+  </agents_to_launch>
+  <report_format>
+    One finding per line: [severity] file:line -- evidence
+  </report_format>
+</parallel_dispatch>"""
+
+
+def format_parallel_dispatch(categories: list[dict]) -> str:
+    return _DISPATCH_TEMPLATE.format(
+        agents="\n".join(cat["agent"] for cat in categories)
+    )
+
+
+# Frozen at import: step specs are lookup tables, not mutable state.
+STEPS = MappingProxyType({
+    1: {
+        "name": "Scope the refactor",
+        "actions": (
+            "Name the files in scope and the behavior that must not change.",
+            "Record the commands that currently prove that behavior (tests,"
+            " type checks, smoke runs) and run them once for a baseline.",
+        ),
+    },
+    2: {
+        "name": "Dispatch category reviews",
+        "actions": (
+            "Review the selected code-quality categories below, then launch"
+            " the dispatch block exactly as printed.",
+        ),
+    },
+    3: {
+        "name": "Collect findings",
+        "actions": (
+            "Merge agent reports, dropping duplicates that cite the same"
+            " file:line for the same category.",
+            "Discard findings outside the scoped files.",
+            "Sort the remainder by severity, then by file.",
+        ),
+    },
+    4: {
+        "name": "Plan the refactor",
+        "actions": (
+            "Group findings into refactor units that can land independently.",
+        ),
+    },
+    5: {
+        "name": "Apply and verify",
+        "actions": (
+            "Apply one refactor unit at a time, smallest first.",
+            "After each unit, re-run the baseline commands from step 1.",
+            "Stop and report if any baseline command regresses.",
+        ),
+    },
+})
+
+TOTAL_STEPS = len(STEPS)
+
+# The header and action lines of every step are static, as is the footer
+# hint; both are joined once at import so format_output only assembles the
+# dynamic middle.
+_STEP_PREFIX = {
+    step: "\n".join(
+        (
+            f"=== Refactor step {step}/{TOTAL_STEPS}: {spec['name']} ===",
+            "",
+            *spec["actions"],
+        )
+    )
+    for step, spec in STEPS.items()
+}
+
+_STEP_FOOTER = {
+    step: "This is the final step."
+    if step == TOTAL_STEPS
+    else f"When done, run: python refactor.py {step + 1}"
+    for step in STEPS
+}
+
+
+_PLANNING_GUIDANCE = "\n".join(
+    (
+        "When grouping findings into refactor units:",
+        "- A unit must leave the tree green on its own.",
+        "- Never mix a behavior-preserving move with a behavior change.",
+        "- Renames ride alone; they dominate diffs and hide logic edits.",
+        "- If two findings touch the same lines, they share a unit.",
+        "- Order units so later ones build on earlier ones, not vice versa.",
+    )
+)
+
+_EXPECTED_SECTIONS = {
+    "findings": "[severity] file:line -- evidence, one per line",
+    "summary": "counts per severity and per category",
+}
+
+
+def format_output(step: int, categories: list[dict] | None = None) -> str:
+    # Blocks are separated by single blank lines, so the whole output is one
+    # join over complete blocks instead of interleaved append("") calls.
+    parts = [_STEP_PREFIX[step]]
+    if step == 2:
+        # Imported here so steps that never render the dispatch block do
+        # not pay for loading the formatters module.
+        from skills.lib.workflow.formatters import format_expected_output
+
+        cats = categories if categories is not None else select_categories(DISPATCH_WIDTH)
+        parts.append(read_refs(cats))
+        parts.append(format_parallel_dispatch(cats))
+        parts.append(format_expected_output(_EXPECTED_SECTIONS))
+    elif step == 4:
+        parts.append(_PLANNING_GUIDANCE)
+    parts.append(_STEP_FOOTER[step])
+    return "\n\n".join(parts)
+
+
+def main() -> None:
+    # Fast path for the common bare-step invocation (see bare_step).
+    step = bare_step(TOTAL_STEPS)
+    if step is not None:
+        write_output(format_output(step))
+        return
+    parser = argparse.ArgumentParser(
+        description="Step-by-step refactor workflow over code-quality categories."
+    )
+    parser.add_argument("step", type=int, help=f"1-based step number (1..{TOTAL_STEPS})")
+    parser.add_argument(
+        "--category",
+        action="append",
+        metavar="PREFIX",
+        help="restrict step 2 to categories matching this name prefix (repeatable)",
+    )
+    args = parser.parse_args()
+    validate_step(parser, args.step, TOTAL_STEPS)
+    categories = None
+    if args.category:
+        categories = []
+        for prefix in args.category:
+            matches = find_categories(prefix)
+            if not matches:
+                parser.error(f"no category matches prefix {prefix!r}")
+            categories.extend(matches)
+    write_output(format_output(args.step, categories))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+from skills.brainstorm import brainstorm
+
+
+def test_format_output_all_steps():
+    for step in range(1, brainstorm.TOTAL_STEPS + 1):
+        out = brainstorm.format_output(step, brainstorm.TOTAL_STEPS)
+        assert f"step {step}/{brainstorm.TOTAL_STEPS}" in out
+    assert "This is the final step." in brainstorm.format_output(
+        brainstorm.TOTAL_STEPS, brainstorm.TOTAL_STEPS
+    )
+
+
+def test_dispatch_covers_every_perspective():
+    out = brainstorm.format_output(2, brainstorm.TOTAL_STEPS)
+    assert out.count("perspective.py") == len(brainstorm.PERSPECTIVE_SUMMARIES)
+
+
+def test_out_of_range_step_falls_back_to_report():
+    out = brainstorm.format_output(99, brainstorm.TOTAL_STEPS)
+    assert "Report" in out
+    assert "This is the final step." in out
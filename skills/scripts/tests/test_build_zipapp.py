@@ -0,0 +1,38 @@
+import subprocess
+import sys
+
+import build_zipapp
+
+
+def _run(target, *args):
+    return subprocess.run(
+        [sys.executable, str(target), *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+def test_bundles_run_standalone(tmp_path):
+    target = build_zipapp.build("brainstorm", tmp_path)
+    assert "Brainstorm step 1/" in _run(target, "--step", "1")
+    assert not (tmp_path / "_staging_brainstorm").exists()
+    # Step 2 must emit commands that work from inside the archive: the
+    # dispatch block points agents back at the .pyz, not at a bundled path.
+    dispatch = _run(target, "--step", "2")
+    assert f"python3 {target} --perspective " in dispatch
+    assert ".pyz/" not in dispatch
+    assert "Skeptic" in _run(target, "--perspective", "skeptic")
+
+
+def test_design_bundle_runs_standalone(tmp_path):
+    target = build_zipapp.build("design", tmp_path)
+    # The invoke-after footer must name the archive, not a relative design.py.
+    step1 = _run(target, "--step", "1")
+    assert "Design step 1/" in step1
+    assert f"python3 {target} --step 2" in step1
+    # The dispatch block routes briefs through the archive as well.
+    dispatch = _run(target, "--step", "3")
+    assert f"python3 {target} --perspective " in dispatch
+    assert ".pyz/" not in dispatch
+    assert "Skeptic" in _run(target, "--perspective", "skeptic")
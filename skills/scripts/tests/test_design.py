@@ -0,0 +1,49 @@
+from skills.design import design
+
+
+def test_format_output_all_steps():
+    for step in range(1, design.TOTAL_STEPS + 1):
+        out = design.format_output(step, design.TOTAL_STEPS)
+        assert f"step {step}/{design.TOTAL_STEPS}" in out
+    assert "This is the final step." in design.format_output(
+        design.TOTAL_STEPS, design.TOTAL_STEPS
+    )
+
+
+def test_dispatch_covers_every_perspective():
+    out = design.format_output(3, design.TOTAL_STEPS)
+    assert out.count("<agent perspective=") == len(design.PERSPECTIVE_SUMMARIES)
+
+
+def test_guidance_rendered_once_at_import():
+    assert design._PERSPECTIVE_GUIDANCE == design.format_perspective_selection_guidance()
+    assert design._PARALLEL_DISPATCH == design.format_parallel_dispatch()
+    out = design.format_output(2, design.TOTAL_STEPS)
+    assert design._PERSPECTIVE_GUIDANCE in out
+
+
+def test_disk_cache_roundtrip(tmp_path, monkeypatch):
+    monkeypatch.setattr(design, "_CACHE_DIR", str(tmp_path))
+    first = design._cached_payload(1, design.TOTAL_STEPS)
+    tag = design._cache_tag()
+    assert (tmp_path / f"design-{tag}-{design.TOTAL_STEPS}-1.txt").read_bytes() == first
+    assert design._cached_payload(1, design.TOTAL_STEPS) == first
+
+
+def test_cache_tag_tracks_contributing_modules():
+    from skills.lib import perspectives
+
+    tag = design._cache_tag()
+    design._cache_tag.cache_clear()
+    assert design._cache_tag() == tag
+    # A perspectives edit must rotate the tag, not just a design.py edit.
+    import os
+
+    mtime = os.path.getmtime(perspectives.__file__)
+    os.utime(perspectives.__file__, (mtime, mtime + 1))
+    try:
+        design._cache_tag.cache_clear()
+        assert design._cache_tag() != tag
+    finally:
+        os.utime(perspectives.__file__, (mtime, mtime))
+        design._cache_tag.cache_clear()
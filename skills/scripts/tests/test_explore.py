@@ -0,0 +1,18 @@
+from skills.explore import explore
+from skills.lib import conventions
+
+
+def test_category_blocks_come_from_shared_catalog():
+    assert "Lenses:" not in explore.format_output(2)
+    step1 = explore.format_output(1)
+    assert "Lenses:" in step1
+    blocks = explore.load_category_blocks()
+    assert len(blocks) == len(conventions.parse_categories())
+    for name, source in blocks:
+        assert f"- {name} (conventions/code-quality/{source})" in step1
+
+
+def test_format_output_all_steps():
+    for step in range(1, explore.TOTAL_STEPS + 1):
+        out = explore.format_output(step)
+        assert f"step {step}/{explore.TOTAL_STEPS}" in out
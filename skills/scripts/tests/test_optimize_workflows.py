@@ -0,0 +1,37 @@
+from skills.optimize import optimize
+from skills.optimize.workflows import SCOPES, WORKFLOWS, change_format_actions
+
+
+def test_scopes_match_workflow_keys():
+    assert set(SCOPES) == set(WORKFLOWS.keys())
+
+
+def test_every_workflow_has_steps_with_actions():
+    for steps in WORKFLOWS.values():
+        assert len(steps) >= 3
+        for step in steps:
+            assert step.name
+            assert step.actions
+            assert all(isinstance(action, str) for action in step.actions)
+
+
+def test_change_format_actions_cached_and_fallback_agree():
+    expected = [
+        "Format each widget:",
+        "  === Widget N: [title] ===",
+        "  [one-line intent of the widget]",
+        "  [rewritten widget, tightest form that keeps behavior]",
+        "Keep numbering stable so revisions stay diffable.",
+    ]
+    assert change_format_actions("Widget") == expected
+    assert change_format_actions("Section")[0] == "Format each section:"
+
+
+def test_format_output_renders_each_step():
+    for scope in SCOPES:
+        total = len(WORKFLOWS[scope])
+        for i, step in enumerate(WORKFLOWS[scope], 1):
+            out = optimize.format_output(scope, i)
+            assert step.name in out
+            assert f"step {i}/{total}" in out
+    assert "This is the final step." in optimize.format_output(SCOPES[0], total)
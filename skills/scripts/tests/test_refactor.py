@@ -0,0 +1,78 @@
+from skills.lib import conventions
+from skills.refactor import refactor
+
+
+def test_parse_categories_finds_all_headings():
+    cats = refactor.parse_categories()
+    assert len(cats) == 34
+    for cat in cats:
+        assert cat["name"]
+        assert cat["file"].endswith(".md")
+        assert cat["line"] >= 1
+        assert cat["ref"] == f"conventions/code-quality/{cat['file']}:{cat['line']}"
+        assert cat["ref"] in cat["agent"]
+
+
+def test_parse_categories_is_cached():
+    assert refactor.parse_categories() is refactor.parse_categories()
+
+
+def test_disk_cache_roundtrip(tmp_path, monkeypatch):
+    monkeypatch.setattr(conventions, "_DISK_CACHE", tmp_path / "categories.pickle")
+    monkeypatch.setattr(conventions, "_CATEGORIES_CACHE", None)
+    first = refactor.parse_categories()
+    assert (tmp_path / "categories.pickle").exists()
+    monkeypatch.setattr(conventions, "_CATEGORIES_CACHE", None)
+    assert refactor.parse_categories() == first
+
+
+def test_disk_cache_ignores_stale_key(tmp_path, monkeypatch):
+    cache = tmp_path / "categories.pickle"
+    cache.write_bytes(b"not a pickle")
+    monkeypatch.setattr(conventions, "_DISK_CACHE", cache)
+    monkeypatch.setattr(conventions, "_CATEGORIES_CACHE", None)
+    assert len(refactor.parse_categories()) == 34
+
+
+def test_load_category_block_spans_one_heading():
+    block = refactor.load_category_block(refactor.parse_categories()[0])
+    assert block.startswith("## 1. ")
+    assert block.count("\n## ") == 0
+
+
+def test_select_categories_reuses_parsed_catalog(monkeypatch):
+    refactor.parse_categories()  # prime the cache
+
+    def _fail_read(*args, **kwargs):
+        raise AssertionError("catalog re-read despite warm cache")
+
+    # Block every read path the parser has: the doc scan and the disk cache.
+    monkeypatch.setattr(conventions.Path, "read_bytes", _fail_read)
+    monkeypatch.setattr(conventions.Path, "open", _fail_read)
+    monkeypatch.setattr(conventions, "_load_disk_cache", _fail_read)
+    for _ in range(3):
+        assert refactor.select_categories(2)
+
+
+def test_select_categories_bounds():
+    assert len(refactor.select_categories(3)) == 3
+    assert len(refactor.select_categories(999)) == 34
+
+
+def test_find_categories_prefix_lookup():
+    naming = refactor.find_categories("naming")
+    assert naming
+    assert all(cat["name"].lower().startswith("naming") for cat in naming)
+    exact = refactor.find_categories("Naming Precision")
+    assert [cat["name"] for cat in exact] == ["Naming Precision"]
+    assert refactor.find_categories("no such category") == []
+
+
+def test_format_output_all_steps():
+    for step in range(1, refactor.TOTAL_STEPS + 1):
+        out = refactor.format_output(step)
+        assert f"step {step}/{refactor.TOTAL_STEPS}" in out
+    dispatch = refactor.format_output(2)
+    assert "<parallel_dispatch>" in dispatch
+    assert dispatch.count("<agent ") == refactor.DISPATCH_WIDTH
+    assert "<expected_output>" in dispatch